@@ -11,6 +11,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 from psutil import cpu_count
 from shapely.geometry import Point
+from shapely.prepared import prep
 
 from adcircpy.forcing import Tides  # , Winds
 from adcircpy.forcing.winds.best_track import BestTrackForcing
@@ -419,10 +420,12 @@ class AdcircRun(Fort15):
 
     def import_stations(self, fort15):
         station_types = ['NOUTE', 'NOUTV', 'NOUTM', 'NOUTC']
+        # the hull is queried once per station, so prepare it only once
+        hull = prep(self.mesh.hull.multipolygon())
         for station_type in station_types:
             stations = Fort15.parse_stations(fort15, station_type)
             for name, vertices in stations.items():
-                if not Point(vertices).within(self.mesh.hull.multipolygon()):
+                if not hull.contains(Point(vertices)):
                     continue
                 if station_type == 'NOUTE':
                     self.add_elevation_output_station(name, vertices)
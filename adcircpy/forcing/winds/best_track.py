@@ -1,6 +1,5 @@
-from collections import Collection
-from datetime import datetime, timedelta
-from functools import wraps
+from datetime import date, datetime, timedelta
+from functools import lru_cache, wraps
 import gzip
 import io
 from io import StringIO
@@ -11,21 +10,79 @@ import time
 from typing import Any
 import urllib.request
 
-from haversine import haversine
-import matplotlib.pyplot as plt
 from matplotlib.transforms import Bbox
 import numpy as np
 import pandas
 from pandas import DataFrame, read_csv
-from pyproj import CRS, Proj, Transformer
-from shapely import ops
-from shapely.geometry import Point, Polygon
-import utm
+from pyproj import CRS, Transformer
 
 from adcircpy.forcing.winds.base import WindForcing
 
 logger = logging.getLogger(__name__)
 
+# mean Earth radius (6371.0088 km) in nautical miles
+_EARTH_RADIUS_NMI = 6371.0088 / 1.852
+
+_RECORD_COLUMNS = (
+    'basin',
+    'storm_number',
+    'datetime',
+    'record_type',
+    'latitude',
+    'longitude',
+    'max_sustained_wind_speed',
+    'central_pressure',
+    'development_level',
+    'isotach',
+    'quadrant',
+    'radius_for_NEQ',
+    'radius_for_SEQ',
+    'radius_for_SWQ',
+    'radius_for_NWQ',
+    'background_pressure',
+    'radius_of_last_closed_isobar',
+    'radius_of_maximum_winds',
+    'name',
+    'direction',
+    'speed',
+)
+
+_FORT22_FORMAT = ','.join([
+    '{:<2}',  # basin
+    '{:>3}',  # storm_number
+    '{:>11}',  # datetime
+    '   ',
+    '{:>5}',  # record_type
+    '{:>4}',  # tau
+    '{:>5}',  # latitude
+    '{:>6}',  # longitude
+    '{:>4}',  # max_sustained_wind_speed
+    '{:>5}',  # central_pressure
+    '{:>3}',  # development_level
+    '{:>4}',  # isotach
+    '{:>4}',  # quadrant
+    '{:>5}',  # radius_for_NEQ
+    '{:>5}',  # radius_for_SEQ
+    '{:>5}',  # radius_for_SWQ
+    '{:>5}',  # radius_for_NWQ
+    '{:>5}',  # background_pressure
+    '{:>5}',  # radius_of_last_closed_isobar
+    '{:>4}',  # radius_of_maximum_winds
+    '     ',  # gust
+    '    ',  # eye
+    '    ',  # subregion
+    '    ',  # maxseas
+    '    ',  # initials
+    '{:>3}',  # direction
+    '{:>4}',  # speed
+    '{:^12}',  # name
+    # from this point forwards it's all aswip
+    '{:>4}',  # record number
+])
+
+_WGS84 = CRS.from_epsg(4326)
+_MERCATOR = CRS.from_epsg(3395)
+
 
 class BestTrackForcing(WindForcing):
     def __init__(self, storm_id, nws: int = 20,
@@ -37,92 +94,74 @@ class BestTrackForcing(WindForcing):
         self._dst_crs = dst_crs
 
     def __str__(self):
+        df = self.df
         record_number = self._generate_record_numbers()
-        fort22 = []
-        for i, (_, row) in enumerate(self.df.iterrows()):
-            line = []
-
-            line.extend([
-                f'{row["basin"]:<2}',
-                f'{row["storm_number"]:>3}',
-                f'{row["datetime"]:%Y%m%d%H}'.rjust(11),
-                f'{"":3}',
-                f'{row["record_type"]:>5}',
-                f'{convert_value((row["datetime"] - self.start_date) / timedelta(hours=1), to_type=int):>4}',
-            ])
-
-            latitude = convert_value(
-                    row['latitude'] / .1,
-                    to_type=int,
-                    round_digits=1,
-            )
-            if latitude >= 0:
-                line.append(f'{latitude:>4}N')
-            else:
-                line.append(f'{latitude * -.1:>4}S')
-
-            longitude = convert_value(
-                    row['longitude'] / .1,
-                    to_type=int,
-                    round_digits=1,
-            )
-            if longitude >= 0:
-                line.append(f'{longitude:>5}E')
-            else:
-                line.append(f'{longitude * -1:>5}W')
-
-            line.extend([
-                f'{convert_value(row["max_sustained_wind_speed"], to_type=int, round_digits=0):>4}',
-                f'{convert_value(row["central_pressure"], to_type=int, round_digits=0):>5}',
-                f'{row["development_level"]:>3}',
-                f'{convert_value(row["isotach"], to_type=int, round_digits=0):>4}',
-                f'{row["quadrant"]:>4}',
-                f'{convert_value(row["radius_for_NEQ"], to_type=int, round_digits=0):>5}',
-                f'{convert_value(row["radius_for_SEQ"], to_type=int, round_digits=0):>5}',
-                f'{convert_value(row["radius_for_SWQ"], to_type=int, round_digits=0):>5}',
-                f'{convert_value(row["radius_for_NWQ"], to_type=int, round_digits=0):>5}',
-            ])
-
-            if row["background_pressure"] is None:
-                row["background_pressure"] = \
-                    self.df["background_pressure"].iloc[i - 1]
-            if (row["background_pressure"] <= row["central_pressure"]
-                    and 1013 > row["central_pressure"]):
-                background_pressure = 1013
-            elif (row["background_pressure"] <= row["central_pressure"]
-                  and 1013 <= row["central_pressure"]):
-                background_pressure = convert_value(
-                        row["central_pressure"] + 1,
-                        to_type=int,
-                        round_digits=0,
-                )
-            else:
-                background_pressure = convert_value(
-                        row['background_pressure'],
-                        to_type=int,
-                        round_digits=0,
-                )
-            line.append(f'{background_pressure:>5}')
-
-            line.extend([
-                f'{convert_value(row["radius_of_last_closed_isobar"], to_type=int, round_digits=0):>5}',
-                f'{convert_value(row["radius_of_maximum_winds"], to_type=int, round_digits=0):>4}',
-                f'{"":>5}',  # gust
-                f'{"":>4}',  # eye
-                f'{"":>4}',  # subregion
-                f'{"":>4}',  # maxseas
-                f'{"":>4}',  # initials
-                f'{row["direction"]:>3}',
-                f'{row["speed"]:>4}',
-                f'{row["name"]:^12}',
-            ])
-
-            # from this point forwards it's all aswip
-            line.append(f'{record_number[i]:>4}')
-
-            fort22.append(','.join(line))
-
-        return '\n'.join(fort22)
+
+        # tenths of a degree followed by the hemisphere
+        latitude = np.around(df['latitude'].values / .1, 1).astype(int)
+        latitude = np.char.add(
+                np.char.rjust(np.abs(latitude).astype(str), 4),
+                np.where(latitude >= 0, 'N', 'S'))
+        longitude = np.around(df['longitude'].values / .1, 1).astype(int)
+        longitude = np.char.add(
+                np.char.rjust(np.abs(longitude).astype(str), 5),
+                np.where(longitude >= 0, 'E', 'W'))
+
+        # records repeat their datetime once per isotach, so format each
+        # datetime once and broadcast it back to the records
+        datetimes, datetime_indices = np.unique(
+                df['datetime'].values, return_inverse=True)
+        datetimes = pandas.DatetimeIndex(datetimes)
+        datetime_strings = np.array([
+            f'{value:%Y%m%d%H}' for value in datetimes
+        ])[datetime_indices]
+        tau = ((datetimes - self.start_date) / timedelta(hours=1)) \
+            .values.astype(int)[datetime_indices]
+
+        background_pressure = df['background_pressure'].astype(float)
+        background_pressure = background_pressure.fillna(
+                background_pressure.shift(1)).values
+        central_pressure = df['central_pressure'].values.astype(float)
+        background_pressure = np.around(np.where(
+                background_pressure > central_pressure,
+                background_pressure,
+                np.where(central_pressure < 1013, 1013, central_pressure + 1),
+        )).astype(int)
+
+        def integers(column: str) -> [int]:
+            return [
+                convert_value(value, to_type=int, round_digits=0)
+                for value in df[column]
+            ]
+
+        columns = [
+            df['basin'],
+            df['storm_number'],
+            datetime_strings,
+            df['record_type'],
+            tau,
+            latitude,
+            longitude,
+            integers('max_sustained_wind_speed'),
+            integers('central_pressure'),
+            df['development_level'],
+            integers('isotach'),
+            df['quadrant'],
+            integers('radius_for_NEQ'),
+            integers('radius_for_SEQ'),
+            integers('radius_for_SWQ'),
+            integers('radius_for_NWQ'),
+            background_pressure,
+            integers('radius_of_last_closed_isobar'),
+            integers('radius_of_maximum_winds'),
+            df['direction'],
+            df['speed'],
+            df['name'],
+            record_number,
+        ]
+
+        return '\n'.join(
+                _FORT22_FORMAT.format(*record) for record in zip(*columns))
 
     def write(self, path: PathLike, overwrite: bool = False):
         if not isinstance(path, pathlib.Path):
@@ -201,31 +240,7 @@ class BestTrackForcing(WindForcing):
                 raise Exception(msg)
             storm_id = _atcf_id
 
-        url = 'ftp://ftp.nhc.noaa.gov/atcf/archive/'
-        url += storm_id[4:]
-        url += '/b'
-        url += storm_id[0:2].lower()
-        url += storm_id[2:]
-        url += '.dat.gz'
-
-        try:
-            logger.info(f'Downloading storm data from {url}')
-            response = urllib.request.urlopen(url)
-        except urllib.error.URLError as e:
-            if '550' in e.reason:
-                raise NameError(
-                        f'Did not find storm with id {storm_id}. '
-                        + f'Submitted URL was {url}.')
-            else:
-                @retry(urllib.error.URLError, tries=4, delay=3, backoff=2)
-                def make_request():
-                    logger.info(f'Downloading storm data from {url} failed, '
-                                'retrying...')
-                    return urllib.request.urlopen(url)
-
-                response = make_request()
-
-        self.__atcf = io.BytesIO(response.read())
+        self.__atcf = io.BytesIO(download_atcf(storm_id, date.today()))
 
     @property
     def start_date(self) -> datetime:
@@ -250,6 +265,7 @@ class BestTrackForcing(WindForcing):
         assert start_date >= self._df['datetime'].iloc[0] \
                and start_date < self._df['datetime'].iloc[-1], msg
         self.__start_date = start_date
+        self.__filtered_df = None
 
     @property
     def end_date(self) -> datetime:
@@ -278,6 +294,7 @@ class BestTrackForcing(WindForcing):
         msg += f"start_date is {self.start_date} and end_date is {end_date}."
         assert end_date > self.start_date, msg
         self.__end_date = end_date
+        self.__filtered_df = None
 
     @property
     def name(self) -> str:
@@ -317,9 +334,11 @@ class BestTrackForcing(WindForcing):
 
     @property
     def df(self):
-        start_date_mask = self._df["datetime"] >= self.start_date
-        end_date_mask = self._df["datetime"] <= self._file_end_date
-        return self._df[start_date_mask & end_date_mask]
+        if self.__filtered_df is None:
+            start_date_mask = self._df["datetime"] >= self.start_date
+            end_date_mask = self._df["datetime"] <= self._file_end_date
+            self.__filtered_df = self._df[start_date_mask & end_date_mask]
+        return self.__filtered_df
 
     @property
     def _df(self):
@@ -327,29 +346,7 @@ class BestTrackForcing(WindForcing):
         try:
             return self.__df
         except AttributeError:
-            data = {
-                "basin": list(),
-                "storm_number": list(),
-                "datetime": list(),
-                "record_type": list(),
-                "latitude": list(),
-                "longitude": list(),
-                "max_sustained_wind_speed": list(),
-                "central_pressure": list(),
-                "development_level": list(),
-                "isotach": list(),
-                "quadrant": list(),
-                "radius_for_NEQ": list(),
-                "radius_for_SEQ": list(),
-                "radius_for_SWQ": list(),
-                "radius_for_NWQ": list(),
-                "background_pressure": list(),
-                "radius_of_last_closed_isobar": list(),
-                "radius_of_maximum_winds": list(),
-                "name": list(),
-                "direction": list(),
-                "speed": list()
-            }
+            data = {column: [] for column in _RECORD_COLUMNS}
             for i, line in enumerate(gzip.GzipFile(fileobj=self.__atcf)):
                 line = line.decode('UTF-8').split(',')
                 data['basin'].append(line[0])
@@ -358,13 +355,11 @@ class BestTrackForcing(WindForcing):
                 _minutes = line[3].strip(' ')
                 if _minutes == '':
                     _minutes = '00'
-                _datetime = _datetime + _minutes
-                data['datetime'].append(
-                        datetime.strptime(_datetime, '%Y%m%d%H%M'))
+                data['datetime'].append(_datetime + _minutes)
                 data['record_type'].append(line[4].strip(' '))
                 if 'N' in line[6]:
                     _lat = float(line[6].strip('N ')) * .1
-                elif 'S' in line:
+                elif 'S' in line[6]:
                     _lat = float(line[6].strip('S ')) * -.1
                 data['latitude'].append(_lat)
                 if 'E' in line[7]:
@@ -412,6 +407,8 @@ class BestTrackForcing(WindForcing):
                     data['radius_of_maximum_winds'].append(
                             data['radius_of_maximum_winds'][-1])
                     data['name'].append('')
+            data['datetime'] = pandas.to_datetime(
+                    data['datetime'], format='%Y%m%d%H%M')
             data = self._compute_velocity(data)
             # data = self._transform_coordinates(data)
             self.__df = DataFrame(data=data)
@@ -420,88 +417,67 @@ class BestTrackForcing(WindForcing):
     def clip_to_bbox(self, bbox, bbox_crs):
         msg = f"bbox must be a {Bbox} instance."
         assert isinstance(bbox, Bbox), msg
-        bbox_pol = Polygon(
-                [[bbox.xmin, bbox.ymin],
-                 [bbox.xmax, bbox.ymin],
-                 [bbox.xmax, bbox.ymax],
-                 [bbox.xmin, bbox.ymax],
-                 [bbox.xmin, bbox.ymin]
-                 ])
-        _switch = True
-        unique_dates = np.unique(self._df['datetime'])
-        _found_start_date = False
-        for _datetime in unique_dates:
-            records = self._df[self._df['datetime'] == _datetime]
-            radii = records['radius_of_last_closed_isobar'].iloc[0]
-            radii = 1852. * radii  # convert to meters
-            lon = records['longitude'].iloc[0]
-            lat = records['latitude'].iloc[0]
-            _, _, number, letter = utm.from_latlon(lat, lon)
-            df_crs = CRS.from_epsg(4326)
-            utm_crs = CRS(
-                    proj='utm',
-                    zone=f'{number}{letter}',
-                    ellps={
-                        'GRS 1980': 'GRS80',
-                        'WGS 84': 'WGS84'
-                    }[df_crs.ellipsoid.name]
-            )
-            transformer = Transformer.from_crs(
-                    df_crs, utm_crs, always_xy=True)
-            p = Point(*transformer.transform(lon, lat))
-            pol = p.buffer(radii)
-            transformer = Transformer.from_crs(
-                    utm_crs, bbox_crs, always_xy=True)
-            pol = ops.transform(transformer.transform, pol)
-            if _switch is True:
-                if not pol.intersects(bbox_pol):
-                    continue
-                else:
-                    self.start_date = records['datetime'].iloc[0]
-                    _found_start_date = True
-                    _switch = False
-                    continue
-
-            else:
-                if pol.intersects(bbox_pol):
-                    continue
-                else:
-                    self.end_date = records['datetime'].iloc[0]
-                    break
-
-        if _found_start_date is False:
+        transformer = _transformer(bbox_crs, _MERCATOR)
+        bbox_x, bbox_y = transformer.transform(
+                [bbox.xmin, bbox.xmax, bbox.xmax, bbox.xmin],
+                [bbox.ymin, bbox.ymin, bbox.ymax, bbox.ymax])
+        mercator_bbox = Bbox([[np.min(bbox_x), np.min(bbox_y)],
+                              [np.max(bbox_x), np.max(bbox_y)]])
+        _, bbox_latitudes = _transformer(_MERCATOR, _WGS84).transform(
+                mercator_bbox.intervalx, mercator_bbox.intervaly)
+
+        # first record of each datetime
+        datetimes, indices = np.unique(
+                self._df['datetime'].values, return_index=True)
+        latitudes = self._df['latitude'].values[indices]
+        x, y = _transformer(_WGS84, _MERCATOR).transform(
+                self._df['longitude'].values[indices], latitudes)
+        # Mercator distances are stretched by sec(latitude); take the larger
+        # stretch between the storm center and the nearest bbox point
+        scale = 1. / np.cos(np.deg2rad(np.maximum(
+                np.abs(latitudes),
+                np.abs(np.clip(latitudes, *bbox_latitudes)))))
+        radii = 1852. * scale \
+            * self._df['radius_of_last_closed_isobar'].values[indices]
+        intersects = _circle_intersects_bbox(x, y, radii, mercator_bbox)
+
+        if not np.any(intersects):
             raise Exception(
                     f'No data within mesh bounding box for storm {self.storm_id}.')
 
+        start_index = np.argmax(intersects)
+        self.start_date = pandas.Timestamp(datetimes[start_index])
+        outside_indices, = np.where(~intersects[start_index:])
+        if len(outside_indices) > 0:
+            self.end_date = pandas.Timestamp(
+                    datetimes[start_index + outside_indices[0]])
+
     def plot_track(self, axes=None, show=False, color='k', **kwargs):
+        import matplotlib.pyplot as plt
+
         kwargs.update({'color': color})
         if axes is None:
             fig = plt.figure()
             axes = fig.add_subplot(111)
-        for i in range(len(self.speed)):
-            # when dealing with nautical degrees, U is sine and V is cosine.
-            U = self.speed.iloc[i] * np.sin(np.deg2rad(self.direction.iloc[i]))
-            V = self.speed.iloc[i] * np.cos(np.deg2rad(self.direction.iloc[i]))
-            axes.quiver(
-                    self.longitude.iloc[i], self.latitude.iloc[i], U, V,
-                    **kwargs)
-            if i % 6 == 0:
-                axes.annotate(
-                        self.df['datetime'].iloc[i],
-                        (self.longitude.iloc[i], self.latitude.iloc[i])
-                )
+        speed = self.speed.values.astype(float)
+        direction = np.deg2rad(self.direction.values.astype(float))
+        longitude = self.longitude.values
+        latitude = self.latitude.values
+        # when dealing with nautical degrees, U is sine and V is cosine.
+        U = speed * np.sin(direction)
+        V = speed * np.cos(direction)
+        axes.quiver(longitude, latitude, U, V, **kwargs)
+        for _datetime, x, y in zip(self.datetime.iloc[::6],
+                                   longitude[::6], latitude[::6]):
+            axes.annotate(_datetime, (x, y))
         if show:
             axes.axis('scaled')
             plt.show()
 
     def _generate_record_numbers(self):
-        record_number = [1]
-        for i in range(1, len(self.datetime)):
-            if self.datetime.iloc[i] == self.datetime.iloc[i - 1]:
-                record_number.append(record_number[-1])
-            else:
-                record_number.append(record_number[-1] + 1)
-        return record_number
+        datetimes = self.datetime.values
+        changed = np.concatenate([[False], datetimes[1:] != datetimes[:-1]])
+        return (1 + np.cumsum(changed)).tolist()
 
     def transform_to(self, crs):
         pass
@@ -509,71 +485,44 @@ class BestTrackForcing(WindForcing):
     @property
     def _file_end_date(self):
         unique_dates = np.unique(self._df['datetime'])
-        for date in unique_dates:
-            if date >= np.datetime64(self.end_date):
-                return date
+        index = np.searchsorted(unique_dates, np.datetime64(self.end_date))
+        if index < len(unique_dates):
+            return unique_dates[index]
 
     @staticmethod
     def _compute_velocity(data):
         """
         Output has units of meters per second.
         """
-        merc = Proj("EPSG:3395")
-        x, y = merc(data['longitude'], data['latitude'])
-        unique_datetimes = np.unique(data['datetime'])
-        for i, _datetime in enumerate(unique_datetimes):
-            indexes, = np.where(
-                    np.asarray(data['datetime']) == _datetime)
-            for idx in indexes:
-                if indexes[-1] + 1 < len(data['datetime']):
-                    dt = ((data['datetime'][indexes[-1] + 1]
-                           - data['datetime'][idx])
-                          .total_seconds() / (60. * 60.))
-                    dx = haversine(
-                            (data['latitude'][idx],
-                             data['longitude'][indexes[-1] + 1]),
-                            (data['latitude'][idx],
-                             data['longitude'][idx]), unit='nmi')
-                    dy = haversine(
-                            (data['latitude'][indexes[-1] + 1],
-                             data['longitude'][idx]),
-                            (data['latitude'][idx],
-                             data['longitude'][idx]), unit='nmi')
-                    vx = np.copysign(
-                            dx / dt,
-                            data['longitude'][indexes[-1] + 1]
-                            - data['longitude'][idx])
-                    vy = np.copysign(
-                            dy / dt,
-                            data['latitude'][indexes[-1] + 1]
-                            - data['latitude'][idx])
-                else:
-                    dt = ((data['datetime'][idx]
-                           - data['datetime'][indexes[0] - 1])
-                          .total_seconds() / (60. * 60.))
-                    dx = haversine(
-                            (data['latitude'][idx],
-                             data['longitude'][indexes[0] - 1]),
-                            (data['latitude'][idx],
-                             data['longitude'][idx]), unit='nmi')
-                    dy = haversine(
-                            (data['latitude'][indexes[0] - 1],
-                             data['longitude'][idx]),
-                            (data['latitude'][idx],
-                             data['longitude'][idx]), unit='nmi')
-                    vx = np.copysign(
-                            dx / dt,
-                            data['longitude'][idx]
-                            - data['longitude'][indexes[0] - 1])
-                    vy = np.copysign(
-                            dy / dt,
-                            data['latitude'][idx]
-                            - data['latitude'][indexes[0] - 1])
-                speed = np.sqrt(dx ** 2 + dy ** 2) / dt
-                bearing = (360. + np.rad2deg(np.arctan2(vx, vy))) % 360
-                data['speed'].append(int(np.around(speed, 0)))
-                data['direction'].append(
-                        int(np.around(bearing, 0)))
+        # datetime64 keeps the searches and differences below out of Python
+        datetimes = pandas.to_datetime(data['datetime']).values
+        latitudes = np.asarray(data['latitude'], dtype=float)
+        longitudes = np.asarray(data['longitude'], dtype=float)
+
+        # pair each record with the first record of the next datetime, or
+        # with the last record of the previous datetime for the final one
+        next_indices = np.searchsorted(datetimes, datetimes, side='right')
+        previous_indices = np.searchsorted(
+                datetimes, datetimes, side='left') - 1
+        has_next = next_indices < len(datetimes)
+        other_indices = np.where(has_next, next_indices, previous_indices)
+
+        dt = np.abs(datetimes[other_indices] - datetimes) \
+            / np.timedelta64(1, 'h')
+        # signed displacements from the earlier to the later record
+        dlon = np.deg2rad(np.where(has_next,
+                                   longitudes[other_indices] - longitudes,
+                                   longitudes - longitudes[other_indices]))
+        dlat = np.deg2rad(np.where(has_next,
+                                   latitudes[other_indices] - latitudes,
+                                   latitudes - latitudes[other_indices]))
+        # haversine distances along the parallel and along the meridian
+        dx = 2. * _EARTH_RADIUS_NMI * np.arcsin(
+                np.cos(np.deg2rad(latitudes)) * np.sin(dlon / 2.))
+        dy = _EARTH_RADIUS_NMI * dlat
+        bearing, speed = _bearing_speed(dx, dy, dt)
+        data['speed'] = np.around(speed, 0).astype(int).tolist()
+        data['direction'] = np.around(bearing, 0).astype(int).tolist()
         return data
 
     @classmethod
@@ -591,130 +540,130 @@ class BestTrackForcing(WindForcing):
         except:
             fort22 = str(fort22).splitlines()
 
-        data = {
-            'basin': [],
-            'storm_number': [],
-            'datetime': [],
-            'record_type': [],
-            'latitude': [],
-            'longitude': [],
-            'max_sustained_wind_speed': [],
-            'central_pressure': [],
-            'development_level': [],
-            'isotach': [],
-            'quadrant': [],
-            'radius_for_NEQ': [],
-            'radius_for_SEQ': [],
-            'radius_for_SWQ': [],
-            'radius_for_NWQ': [],
-            'background_pressure': [],
-            'radius_of_last_closed_isobar': [],
-            'radius_of_maximum_winds': [],
-            'name': [],
-            'direction': [],
-            'speed': [],
-        }
+        data = {column: [] for column in _RECORD_COLUMNS}
 
         for index, row in enumerate(fort22):
             row = [value.strip() for value in row.split(',')]
 
-            row_data = {key: None for key in data}
-
-            row_data['basin'] = row[0]
-            row_data['storm_number'] = row[1]
-            row_data['datetime'] = datetime.strptime(row[2], '%Y%m%d%H')
-            row_data['record_type'] = row[4]
+            data['basin'].append(row[0])
+            data['storm_number'].append(row[1])
+            data['datetime'].append(datetime.strptime(row[2], '%Y%m%d%H'))
+            data['record_type'].append(row[4])
 
             latitude = row[6]
             if 'N' in latitude:
                 latitude = float(latitude[:-1]) * 0.1
             elif 'S' in latitude:
                 latitude = float(latitude[:-1]) * -0.1
-            row_data['latitude'] = latitude
+            data['latitude'].append(latitude)
 
             longitude = row[7]
             if 'E' in longitude:
                 longitude = float(longitude[:-1]) * 0.1
             elif 'W' in longitude:
                 longitude = float(longitude[:-1]) * -0.1
-            row_data['longitude'] = longitude
+            data['longitude'].append(longitude)
 
-            row_data['max_sustained_wind_speed'] = convert_value(
+            data['max_sustained_wind_speed'].append(convert_value(
                     row[8],
                     to_type=int,
                     round_digits=0,
-            )
-            row_data['central_pressure'] = convert_value(
+            ))
+            data['central_pressure'].append(convert_value(
                     row[9],
                     to_type=int,
                     round_digits=0,
-            )
-            row_data['development_level'] = row[10]
-            row_data['isotach'] = convert_value(
+            ))
+            data['development_level'].append(row[10])
+            data['isotach'].append(convert_value(
                     row[11],
                     to_type=int,
                     round_digits=0,
-            )
-            row_data['quadrant'] = row[12]
-            row_data['radius_for_NEQ'] = convert_value(
+            ))
+            data['quadrant'].append(row[12])
+            data['radius_for_NEQ'].append(convert_value(
                     row[13],
                     to_type=int,
                     round_digits=0,
-            )
-            row_data['radius_for_SEQ'] = convert_value(
+            ))
+            data['radius_for_SEQ'].append(convert_value(
                     row[14],
                     to_type=int,
                     round_digits=0,
-            )
-            row_data['radius_for_SWQ'] = convert_value(
+            ))
+            data['radius_for_SWQ'].append(convert_value(
                     row[15],
                     to_type=int,
                     round_digits=0,
-            )
-            row_data['radius_for_NWQ'] = convert_value(
+            ))
+            data['radius_for_NWQ'].append(convert_value(
                     row[16],
                     to_type=int,
                     round_digits=0,
-            )
-            row_data['background_pressure'] = convert_value(
+            ))
+            data['background_pressure'].append(convert_value(
                     row[17],
                     to_type=int,
                     round_digits=0,
-            )
-            row_data['radius_of_last_closed_isobar'] = convert_value(
+            ))
+            data['radius_of_last_closed_isobar'].append(convert_value(
                     row[18],
                     to_type=int,
                     round_digits=0,
-            )
-            row_data['radius_of_maximum_winds'] = convert_value(
+            ))
+            data['radius_of_maximum_winds'].append(convert_value(
                     row[19],
                     to_type=int,
                     round_digits=0,
-            )
-            row_data['direction'] = row[25]
-            row_data['speed'] = row[26]
-            row_data['name'] = row[27]
-
-            for key, value in row_data.items():
-                if isinstance(data[key], Collection):
-                    data[key].append(value)
-                elif data[key] is None:
-                    data[key] = value
+            ))
+            data['direction'].append(row[25])
+            data['speed'].append(row[26])
+            data['name'].append(row[27])
 
         storm_id = f'{data["name"][0]}{data["datetime"][0]:%Y}'
 
-        instance = cls(
+        # assign the records before initializing so that the date setters
+        # do not parse (and then discard) the downloaded ATCF data
+        instance = cls.__new__(cls)
+        instance.__df = pandas.DataFrame(data=data)
+        instance.__init__(
                 storm_id=storm_id,
                 nws=nws,
                 start_date=min(data['datetime']),
                 end_date=max(data['datetime']),
         )
 
-        instance.__df = pandas.DataFrame(data=data)
-
         return instance
 
 
+def _circle_intersects_bbox(x: np.ndarray, y: np.ndarray,
+                            radius: np.ndarray, bbox: Bbox) -> np.ndarray:
+    """
+    Whether the circles of the given `radius` centered on `x`, `y` intersect
+    the axis-aligned `bbox`, by comparing the distance from each center to the
+    nearest point of the bbox against the radius.
+    """
+    dx = np.maximum(0., np.maximum(bbox.xmin - x, x - bbox.xmax))
+    dy = np.maximum(0., np.maximum(bbox.ymin - y, y - bbox.ymax))
+    return dx ** 2 + dy ** 2 <= radius ** 2
+
+
+def _bearing_speed(dx: np.ndarray, dy: np.ndarray, dt: np.ndarray):
+    """
+    Nautical bearing (degrees clockwise from north) and speed of the eastward
+    and northward displacements `dx` and `dy` covered in `dt` hours.
+    """
+    bearing = (360. + np.rad2deg(np.arctan2(dx, dy))) % 360
+    speed = np.hypot(dx, dy) / dt
+    return bearing, speed
+
+
+@lru_cache(maxsize=None)
+def _transformer(crs_from, crs_to) -> Transformer:
+    # building a transformer loads the PROJ database, so reuse them
+    return Transformer.from_crs(crs_from, crs_to, always_xy=True)
+
+
 def convert_value(value: Any, to_type: type, round_digits: int = None) -> Any:
     if value is not None and value != '':
         if round_digits is not None and issubclass(to_type, (int, float)):
@@ -769,7 +718,46 @@ def retry(ExceptionToCheck, tries=4, delay=3, backoff=2, logger=None):
     return deco_retry
 
 
-def atcf_id(storm_id):
+@lru_cache(maxsize=32)
+def download_atcf(storm_id: str, day: date) -> bytes:
+    """
+    Download the gzipped ATCF b-deck of the given storm. `day` is only part of
+    the cache key, so that records of active storms are refreshed daily;
+    call `download_atcf.cache_clear()` to force a new download sooner.
+    """
+    url = 'ftp://ftp.nhc.noaa.gov/atcf/archive/'
+    url += storm_id[4:]
+    url += '/b'
+    url += storm_id[0:2].lower()
+    url += storm_id[2:]
+    url += '.dat.gz'
+
+    try:
+        logger.info(f'Downloading storm data from {url}')
+        response = urllib.request.urlopen(url)
+    except urllib.error.URLError as e:
+        if '550' in e.reason:
+            raise NameError(
+                    f'Did not find storm with id {storm_id}. '
+                    + f'Submitted URL was {url}.')
+        else:
+            @retry(urllib.error.URLError, tries=4, delay=3, backoff=2)
+            def make_request():
+                logger.info(f'Downloading storm data from {url} failed, '
+                            'retrying...')
+                return urllib.request.urlopen(url)
+
+            response = make_request()
+
+    return response.read()
+
+
+@lru_cache(maxsize=1)
+def storm_table(day: date) -> DataFrame:
+    """
+    Download the NHC storm table. As with `download_atcf`, `day` is only part
+    of the cache key, so that newly added storms are picked up daily.
+    """
     url = 'ftp://ftp.nhc.noaa.gov/atcf/archive/storm.table'
 
     @retry(urllib.error.URLError, tries=4, delay=3, backoff=2)
@@ -778,10 +766,14 @@ def atcf_id(storm_id):
         return urllib.request.urlopen(url)
 
     res = request_url()
-    df = read_csv(
+    return read_csv(
             StringIO("".join([_.decode('utf-8') for _ in res])),
             header=None,
     )
+
+
+def atcf_id(storm_id):
+    df = storm_table(date.today())
     name = storm_id[:-4]
     year = storm_id[-4:]
     entry = df.loc[(df[0] == name.upper().rjust(10)) & (df[8] == int(year))]
@@ -53,42 +53,33 @@ def graph(sms2dm):
 
 def nodes(sms2dm):
     assert all(int(id) > 0 for id in sms2dm['ND'])
-    f = ''
-    for id, (coords, value) in sms2dm['ND'].items():
-        f += f"ND {int(id):d} "
-        f += f"{coords[0]:<.16E} "
-        f += f"{coords[1]:<.16E} "
-        f += f"{value:<.16E}\n"
-    return f
+    return ''.join(
+        f"ND {int(id):d} {coords[0]:<.16E} {coords[1]:<.16E} {value:<.16E}\n"
+        for id, (coords, value) in sms2dm['ND'].items()
+    )
 
 
 def boundaries(sms2dm):
-    f = ''
+    f = []
     if 'boundaries' in sms2dm.keys():
         for ibtype, bnds in sms2dm['boundaries'].items():
             for id, bnd in bnds.items():
-                f += nodestring(bnd['indexes'])
-    return f
+                f.append(nodestring(bnd['indexes']))
+    return ''.join(f)
 
 
 def geom_string(geom_type, sms2dm):
     assert geom_type in ['E3T', 'E4Q', 'E6T', 'E8Q', 'E9Q']
     assert all(int(id) > 0 for id in sms2dm[geom_type])
-    f = ''
-    for id, geom in sms2dm[geom_type].items():
-        f += f"{geom_type} {id} "
-        for j in range(len(geom)):
-            f += f"{geom[j]} "
-        f += "\n"
-    return f
+    return ''.join(
+        f"{geom_type} {id} " + ''.join(f"{node} " for node in geom) + "\n"
+        for id, geom in sms2dm[geom_type].items()
+    )
 
 
 def nodestring(geom):
-    f = "NS "
-    for i in range(len(geom) - 1):
-        f += f"{geom[i]} "
-    f += f"-{geom[-1]}\n"
-    return f
+    return "NS " + ''.join(f"{node} " for node in geom[:-1]) \
+        + f"-{geom[-1]}\n"
 
 
 def nodestrings(geom):
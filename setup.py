@@ -59,7 +59,6 @@ setuptools.setup(
             'seaborn',
             'shapely',
             'tropycal',
-            'utm',
             'wget',
         ],
         # test and development dependencies
@@ -1,15 +1,55 @@
+from datetime import date, datetime
+import gzip
+import io
 from pathlib import Path
 import unittest
+from unittest.mock import patch
+
+from matplotlib.transforms import Bbox
 
 from adcircpy.forcing.winds import BestTrackForcing
+from adcircpy.forcing.winds.best_track import download_atcf, storm_table
 
 DATA_DIRECTORY = Path(__file__).parent / 'data'
 INPUT_DIRECTORY = DATA_DIRECTORY / 'input'
 OUTPUT_DIRECTORY = DATA_DIRECTORY / 'output'
 REFERENCE_DIRECTORY = DATA_DIRECTORY / 'reference'
 
+# southern and eastern hemisphere track
+WINSTON_FORT22 = INPUT_DIRECTORY / 'test_besttrack' / 'winston2016_fort.22'
+# IRMA fort.22 with a radius of last closed isobar of 150 nmi on every record
+IRMA_ROCI_FORT22 = INPUT_DIRECTORY / 'test_besttrack' / 'irma2017_roci_fort.22'
+
+
+def mock_urlopen(fort22: Path, storm_id: str, name: str, year: int):
+    """
+    Stand-in for `urllib.request.urlopen` that serves an NHC storm table
+    containing only the given storm, and a b-deck made of the fort.22 records.
+    """
+    with open(fort22, 'rb') as fort22_file:
+        b_deck = gzip.compress(fort22_file.read())
+    table = ','.join([name.rjust(10), *[''] * 7, str(year), *[''] * 11,
+                      storm_id])
+
+    def urlopen(url):
+        if url.endswith('storm.table'):
+            return io.BytesIO(f'{table}\n'.encode('utf-8'))
+        return io.BytesIO(b_deck)
+
+    return urlopen
+
+
+def irma_roci(**kwargs) -> BestTrackForcing:
+    urlopen = mock_urlopen(IRMA_ROCI_FORT22, 'AL112017', 'IRMA', 2017)
+    with patch('urllib.request.urlopen', side_effect=urlopen):
+        return BestTrackForcing.from_fort22(IRMA_ROCI_FORT22, **kwargs)
+
 
 class TestBestTrack(unittest.TestCase):
+    def setUp(self):
+        download_atcf.cache_clear()
+        storm_table.cache_clear()
+
     def test_from_fort22(self):
         input_filename = INPUT_DIRECTORY / 'test_besttrack' / 'irma2017_fort.22'
         output_filename = OUTPUT_DIRECTORY / 'test_besttrack' / 'irma2017_fort.22'
@@ -31,3 +71,100 @@ class TestBestTrack(unittest.TestCase):
         with open(output_filename) as test_file:
             with open(reference_filename) as reference_file:
                 assert test_file.read() == reference_file.read()
+
+    def test_download_cache(self):
+        urlopen = mock_urlopen(IRMA_ROCI_FORT22, 'AL112017', 'IRMA', 2017)
+        with patch('urllib.request.urlopen', side_effect=urlopen) as mock:
+            BestTrackForcing.from_fort22(IRMA_ROCI_FORT22)
+            # storm table and b-deck
+            assert mock.call_count == 2
+
+            BestTrackForcing.from_fort22(IRMA_ROCI_FORT22)
+            BestTrackForcing('AL112017')
+            assert mock.call_count == 2
+
+            # the b-deck is downloaded again on another day
+            download_atcf('AL112017', date(2017, 9, 5))
+            assert mock.call_count == 3
+
+    def test_clip_to_bbox(self):
+        best_track = irma_roci()
+        assert best_track.start_date == datetime(2017, 9, 5, 0)
+        assert best_track.end_date == datetime(2017, 9, 12, 0)
+
+        # clips both ends of the track
+        best_track.clip_to_bbox(Bbox([[-70, 18], [-60, 25]]), 'EPSG:4326')
+        assert best_track.start_date == datetime(2017, 9, 5, 12)
+        assert best_track.end_date == datetime(2017, 9, 8, 6)
+
+    def test_clip_to_bbox_start(self):
+        best_track = irma_roci()
+
+        # the track ends inside the bounding box
+        best_track.clip_to_bbox(Bbox([[-90, 30], [-80, 40]]), 'EPSG:4326')
+        assert best_track.start_date == datetime(2017, 9, 11, 6)
+        assert best_track.end_date == datetime(2017, 9, 12, 0)
+
+    def test_clip_to_bbox_projected(self):
+        best_track = irma_roci()
+
+        # UTM zone 17N, around the Florida Keys
+        best_track.clip_to_bbox(
+                Bbox([[500000, 2700000], [600000, 2800000]]), 'EPSG:32617')
+        assert best_track.start_date == datetime(2017, 9, 9, 12)
+        assert best_track.end_date == datetime(2017, 9, 11, 6)
+
+    def test_clip_to_bbox_no_data(self):
+        best_track = irma_roci()
+
+        with self.assertRaisesRegex(
+                Exception, 'No data within mesh bounding box for storm AL112017'):
+            best_track.clip_to_bbox(Bbox([[-100, 0], [-95, 5]]), 'EPSG:4326')
+
+    def test_southern_eastern_hemisphere(self):
+        output_filename = OUTPUT_DIRECTORY / 'test_besttrack' / 'winston2016_fort.22'
+        reference_filename = REFERENCE_DIRECTORY / 'test_besttrack' / 'winston2016_fort.22'
+
+        if not output_filename.parent.exists():
+            output_filename.parent.mkdir(parents=True, exist_ok=True)
+
+        urlopen = mock_urlopen(WINSTON_FORT22, 'SH112016', 'WINSTON', 2016)
+        with patch('urllib.request.urlopen', side_effect=urlopen):
+            best_track = BestTrackForcing.from_fort22(WINSTON_FORT22)
+            downloaded = BestTrackForcing('SH112016')
+
+            assert best_track.storm_id == 'SH112016'
+            assert best_track.name == 'WINSTON'
+
+            best_track.write(output_filename, overwrite=True)
+
+            with open(output_filename) as test_file:
+                with open(reference_filename) as reference_file:
+                    assert test_file.read() == reference_file.read()
+
+            assert (downloaded.df['latitude'] < 0).all()
+            assert (downloaded.df['longitude'] > 0).all()
+
+    def test_set_dates(self):
+        best_track = irma_roci()
+        records = len(best_track.df)
+        fort22 = str(best_track)
+
+        best_track.start_date = datetime(2017, 9, 7, 0)
+        best_track.end_date = datetime(2017, 9, 9, 0)
+
+        assert len(best_track.df) < records
+        assert best_track.df['datetime'].min() == datetime(2017, 9, 7, 0)
+        assert best_track.df['datetime'].max() == datetime(2017, 9, 9, 0)
+
+        lines = [line.split(',') for line in str(best_track).splitlines()]
+        assert str(best_track) != fort22
+        assert len(lines) == len(best_track.df)
+        assert lines[0][2].strip() == '2017090700'
+        assert lines[-1][2].strip() == '2017090900'
+        # TAU is counted from the new start date
+        assert int(lines[0][5]) == 0
+        assert int(lines[-1][5]) == 48
+        # records are numbered from the new start date, one per datetime
+        assert int(lines[0][-1]) == 1
+        assert int(lines[-1][-1]) == 9